@@ -3,8 +3,8 @@ Sample Python file for testing parser
 Contains various symbol types and patterns
 """
 
-from typing import List, Optional
-import datetime
+from typing import Dict, List, Optional
+import time
 
 
 # Constants
@@ -15,17 +15,22 @@ DEFAULT_NAME = "Unknown"
 class Item:
     """Represents an item in inventory"""
 
-    def __init__(self, name: str, quantity: int = 0):
+    __slots__ = ("name", "quantity", "_created_at")
+
+    def __init__(self, name: str, quantity: int = 0,
+                 created_at: Optional[float] = None):
         """
         Initialize an item
 
         Args:
             name: Item name
             quantity: Initial quantity (default 0)
+            created_at: Creation time as a Unix timestamp (default now);
+                pass one shared value to timestamp a batch of items
         """
         self.name = name
         self.quantity = quantity
-        self._created_at = datetime.datetime.now()
+        self._created_at = time.time() if created_at is None else created_at
 
     def add_quantity(self, amount: int) -> None:
         """Add to item quantity"""
@@ -34,8 +39,7 @@ class Item:
     @property
     def age_days(self) -> int:
         """Get item age in days"""
-        delta = datetime.datetime.now() - self._created_at
-        return delta.days
+        return int((time.time() - self._created_at) // 86400)
 
     @staticmethod
     def create_default() -> 'Item':
@@ -47,10 +51,21 @@ class Item:
 
 
 class Inventory:
-    """Manages collection of items"""
+    """Manages collection of items
+
+    Storage is preallocated to MAX_ITEMS slots; only the first `count`
+    are filled.
+    """
 
     def __init__(self):
-        self.items: List[Item] = []
+        self.items: List[Optional[Item]] = [None] * MAX_ITEMS
+        self._by_name: Dict[str, Item] = {}
+        self._n = 0
+
+    @property
+    def count(self) -> int:
+        """Number of items added"""
+        return self._n
 
     def add_item(self, item: Item) -> bool:
         """
@@ -62,31 +77,23 @@ class Inventory:
         Returns:
             True if added successfully
         """
-        if len(self.items) >= MAX_ITEMS:
+        n = self._n
+        if n >= MAX_ITEMS:
             return False
-        self.items.append(item)
+        self.items[n] = item
+        self._n = n + 1
+        # Keep the first item per name, matching a front-to-back scan
+        self._by_name.setdefault(item.name, item)
         return True
 
     def find_by_name(self, name: str) -> Optional[Item]:
         """Find item by name"""
-        for item in self.items:
-            if item.name == name:
-                return item
-        return None
+        return self._by_name.get(name)
 
 
 def calculate_total_quantity(inventory: Inventory) -> int:
     """Calculate total quantity across all items"""
-    total = 0
-
-    def add_item_quantity(item: Item) -> None:
-        nonlocal total
-        total += item.quantity
-
-    for item in inventory.items:
-        add_item_quantity(item)
-
-    return total
+    return sum(item.quantity for item in inventory.items[:inventory.count])
 
 
 # Lambda function
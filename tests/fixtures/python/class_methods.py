@@ -2,10 +2,17 @@
 Class with methods for testing Python method chunking
 """
 
+import math
+from collections.abc import Iterable
+
+from http_session import get_session
+
 
 class Calculator:
     """Calculator class with basic arithmetic operations."""
 
+    __slots__ = ("precision", "history")
+
     def __init__(self, precision: int = 2):
         """Constructor initializes the calculator.
 
@@ -13,7 +20,8 @@ class Calculator:
             precision: Number of decimal places (default: 2)
         """
         self.precision = precision
-        self.history = []
+        # (operator, a, b, result) tuples, formatted on read
+        self.history: list[tuple[str, float, float, float]] = []
 
     def add(self, a: float, b: float) -> float:
         """Adds two numbers.
@@ -26,7 +34,7 @@ class Calculator:
             Sum of a and b
         """
         result = a + b
-        self.history.append(f"{a} + {b} = {result}")
+        self.history.append(('+', a, b, result))
         return self._round_to_precision(result)
 
     def subtract(self, a: float, b: float) -> float:
@@ -40,7 +48,7 @@ class Calculator:
             Difference of a and b
         """
         result = a - b
-        self.history.append(f"{a} - {b} = {result}")
+        self.history.append(('-', a, b, result))
         return self._round_to_precision(result)
 
     def multiply(self, a: float, b: float) -> float:
@@ -57,12 +65,10 @@ class Calculator:
         Returns:
             Calculated value
         """
-        import aiohttp
-        async with aiohttp.ClientSession() as session:
-            url = f"/api/calculate?expr={expression}"
-            async with session.get(url) as response:
-                data = await response.json()
-                return data['value']
+        url = f"/api/calculate?expr={expression}"
+        async with get_session().get(url) as response:
+            data = await response.json()
+            return data['value']
 
     def calculate_steps(self, a: float, b: float):
         """Generator method that yields calculation steps.
@@ -90,13 +96,13 @@ class Calculator:
         """
         return round(value, self.precision)
 
-    def get_history(self) -> list[str]:
+    def get_history(self) -> tuple[str, ...]:
         """Gets the calculation history.
 
         Returns:
-            List of calculation history strings
+            Immutable snapshot of calculation history strings
         """
-        return self.history.copy()
+        return tuple(f"{a} {op} {b} = {result}" for op, a, b, result in self.history)
 
     def clear_history(self) -> None:
         """Clears the history."""
@@ -123,6 +129,8 @@ class ScientificCalculator(Calculator):
     Inherits from Calculator and adds scientific functions.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         """Constructor with default high precision."""
         super().__init__(precision=10)
@@ -135,9 +143,25 @@ class ScientificCalculator(Calculator):
             exponent: Exponent
 
         Returns:
-            base^exponent
+            base^exponent, always as a float
+
+        Raises:
+            OverflowError: If the result is too large for a float
+            ValueError: If base is negative and exponent is not an integer
         """
-        return base ** exponent
+        return math.pow(base, exponent)
+
+    def power_vec(self, bases: Iterable[float], exponents: Iterable[float]) -> list[float]:
+        """Calculates powers element-wise.
+
+        Args:
+            bases: Base numbers
+            exponents: Exponents, paired with bases
+
+        Returns:
+            List of base^exponent for each pair
+        """
+        return list(map(math.pow, bases, exponents))
 
     def sqrt(self, value: float) -> float:
         """Calculates square root.
@@ -148,7 +172,6 @@ class ScientificCalculator(Calculator):
         Returns:
             Square root of value
         """
-        import math
         return math.sqrt(value)
 
 
@@ -156,6 +179,8 @@ class ScientificCalculator(Calculator):
 class LoggingMixin:
     """Mixin that adds logging capability."""
 
+    __slots__ = ()
+
     def log(self, message: str) -> None:
         """Logs a message.
 
@@ -168,6 +193,8 @@ class LoggingMixin:
 class LoggingCalculator(Calculator, LoggingMixin):
     """Calculator with logging capability."""
 
+    __slots__ = ()
+
     def add(self, a: float, b: float) -> float:
         """Adds two numbers with logging."""
         self.log(f"Adding {a} + {b}")
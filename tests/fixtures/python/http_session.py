@@ -0,0 +1,41 @@
+"""
+Shared aiohttp client session for the fetch examples
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+try:
+    import aiohttp
+except ImportError:  # optional, only needed for fetches
+    aiohttp = None
+
+_session: aiohttp.ClientSession | None = None
+_session_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_session() -> aiohttp.ClientSession:
+    """Returns the shared client session for the running event loop.
+
+    A session is bound to the loop it was created on, so a new one is
+    created when called from a different loop (e.g. a later asyncio.run).
+    Await close_session() before the loop ends to release it.
+    """
+    global _session, _session_loop
+    if aiohttp is None:
+        raise RuntimeError("aiohttp is required for fetching")
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession()
+        _session_loop = loop
+    return _session
+
+
+async def close_session() -> None:
+    """Closes the shared client session."""
+    global _session, _session_loop
+    if _session is not None:
+        await _session.close()
+    _session = None
+    _session_loop = None
@@ -2,6 +2,14 @@
 Simple function examples for testing Python chunking
 """
 
+import logging
+from array import array
+from functools import wraps
+
+from http_session import get_session
+
+log = logging.getLogger(__name__)
+
 
 def add(a: int, b: int) -> int:
     """Calculates the sum of two numbers.
@@ -49,10 +57,8 @@ async def fetch_data(url: str) -> str:
     Returns:
         Response text
     """
-    import aiohttp
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url) as response:
-            return await response.text()
+    async with get_session().get(url) as response:
+        return await response.text()
 
 
 # Generator function
@@ -65,8 +71,19 @@ def number_generator(max: int):
     Yields:
         Numbers from 0 to max-1
     """
-    for i in range(max):
-        yield i
+    yield from range(max)
+
+
+def number_array(max: int) -> array:
+    """Builds the numbers from 0 to max in one packed array.
+
+    Args:
+        max: Number of values to build
+
+    Returns:
+        array('q') holding 0 to max-1
+    """
+    return array('q', range(max))
 
 
 # Lambda (anonymous function - should not be chunked)
@@ -76,8 +93,10 @@ square = lambda n: n * n
 # Function with decorator
 def decorator_example(func):
     """Example decorator function."""
+    @wraps(func)
     def wrapper(*args, **kwargs):
-        print(f"Calling {func.__name__}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Calling %s", func.__name__)
         return func(*args, **kwargs)
     return wrapper
 
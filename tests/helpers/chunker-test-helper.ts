@@ -4,9 +4,12 @@
  */
 
 import Parser from 'tree-sitter';
+import { promises as fs } from 'fs';
 import { CodeChunker } from '../../src/services/chunker/CodeChunker.js';
 import { Language } from '../../src/models/ChunkTypes.js';
+import type { Chunk } from '../../src/models/Chunk.js';
 import { loadGrammar } from '../../src/services/parser/LanguageLoader.js';
+import { memoizeByFileVersion } from './fixture-cache-helper.js';
 
 // Cache loaded grammars
 let typescriptGrammar: any = null;
@@ -104,3 +107,17 @@ export async function parseAndChunk(
   // Chunk the file
   return chunker.chunkFile(filePath, fileId, tree, language);
 }
+
+/**
+ * Read, parse and chunk a fixture file, reusing the result for the same file
+ * The returned chunks are shared between callers and must not be mutated
+ * @param filePath Absolute path to the fixture file
+ * @param language Language to use
+ * @returns Array of chunks
+ */
+export function chunkFixture(filePath: string, language: Language): Promise<Chunk[]> {
+  return memoizeByFileVersion(filePath, `chunks:${language}`, async () => {
+    const content = await fs.readFile(filePath, 'utf-8');
+    return parseAndChunk(filePath, content, language);
+  });
+}
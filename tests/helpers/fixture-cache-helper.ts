@@ -0,0 +1,39 @@
+/**
+ * Fixture cache helper
+ * Memoizes per-fixture work in-process, keyed by file path and mtime, so
+ * test files sharing a fixture only load it once per worker
+ */
+
+import { promises as fs } from 'fs';
+
+// Pending results keyed by `${path}:${mtimeNs}:${extraKey}`
+const cache = new Map<string, Promise<unknown>>();
+
+/**
+ * Run a loader once per version of a file, reusing its result afterwards
+ * The key includes the file's mtime so edits during a watch run invalidate
+ * the entry; rejected loads are evicted so they are retried on next call.
+ * Results are shared between callers and must not be mutated.
+ *
+ * @param filePath Absolute path to the file the result is derived from
+ * @param extraKey Distinguishes different results derived from the same file
+ * @param loader Produces the result on a miss
+ * @returns The cached or newly loaded result
+ */
+export async function memoizeByFileVersion<T>(
+  filePath: string,
+  extraKey: string,
+  loader: () => Promise<T>
+): Promise<T> {
+  const { mtimeNs } = await fs.stat(filePath, { bigint: true });
+  const key = `${filePath}:${mtimeNs}:${extraKey}`;
+
+  let pending = cache.get(key) as Promise<T> | undefined;
+  if (!pending) {
+    pending = loader();
+    cache.set(key, pending);
+    pending.catch(() => cache.delete(key));
+  }
+
+  return pending;
+}
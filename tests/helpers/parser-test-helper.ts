@@ -0,0 +1,151 @@
+/**
+ * Parser test helper
+ * Provides a persistent on-disk cache of parsed fixture ASTDocs so repeat
+ * test runs skip Tree-sitter parsing for fixtures that have not changed,
+ * plus an in-process cache so test files sharing a fixture parse it once
+ */
+
+import { createHash, randomUUID } from 'crypto';
+import { promises as fs } from 'fs';
+import path from 'path';
+import { parse } from '../../src/services/parser/index.js';
+import type { ASTDoc } from '../../src/models/ASTDoc.js';
+import { memoizeByFileVersion } from './fixture-cache-helper.js';
+
+const PROJECT_ROOT = path.join(__dirname, '../..');
+
+/** Directory holding cached ASTDoc JSON files (git-ignored) */
+export const AST_CACHE_DIR = path.join(PROJECT_ROOT, 'tests/fixtures/_ast_cache');
+
+/** Sources whose contents determine the ASTDoc produced for a fixture */
+const PARSER_SOURCE_DIR = path.join(PROJECT_ROOT, 'src/services/parser');
+const PARSER_MODEL_FILES = [path.join(PROJECT_ROOT, 'src/models/ASTDoc.ts')];
+
+let parserFingerprint: Promise<string> | null = null;
+
+/**
+ * List every file under a directory, sorted for a stable hash order
+ */
+async function listFiles(dir: string): Promise<string[]> {
+  const entries = await fs.readdir(dir, { withFileTypes: true });
+  const files = await Promise.all(
+    entries.map(entry => {
+      const fullPath = path.join(dir, entry.name);
+      return entry.isDirectory() ? listFiles(fullPath) : Promise.resolve([fullPath]);
+    })
+  );
+  return files.flat().sort();
+}
+
+/**
+ * Read the installed version of a package, or 'missing' if not installed
+ */
+async function getInstalledVersion(name: string): Promise<string> {
+  try {
+    const json = await fs.readFile(path.join(PROJECT_ROOT, 'node_modules', name, 'package.json'), 'utf-8');
+    return (JSON.parse(json) as { version: string }).version;
+  } catch (error) {
+    if ((error as NodeJS.ErrnoException).code === 'ENOENT') {
+      return 'missing';
+    }
+    throw error;
+  }
+}
+
+/**
+ * Hash the parser sources and installed Tree-sitter package versions
+ * Computed once per process; any edit to the extractors or a grammar
+ * upgrade produces a new fingerprint and therefore new cache keys
+ */
+function getParserFingerprint(): Promise<string> {
+  if (!parserFingerprint) {
+    parserFingerprint = (async () => {
+      const hash = createHash('sha256');
+
+      const files = [...await listFiles(PARSER_SOURCE_DIR), ...PARSER_MODEL_FILES];
+      for (const file of files) {
+        hash.update(path.relative(PROJECT_ROOT, file));
+        hash.update('\0');
+        hash.update(await fs.readFile(file));
+        hash.update('\0');
+      }
+
+      const pkg = JSON.parse(
+        await fs.readFile(path.join(PROJECT_ROOT, 'package.json'), 'utf-8')
+      ) as { dependencies?: Record<string, string> };
+      const grammars = Object.keys(pkg.dependencies ?? {})
+        .filter(name => name.startsWith('tree-sitter'))
+        .sort();
+      for (const name of grammars) {
+        hash.update(`${name}@${await getInstalledVersion(name)}\0`);
+      }
+
+      return hash.digest('hex');
+    })();
+  }
+  return parserFingerprint;
+}
+
+/**
+ * Build the cache key for a fixture
+ * Key = sha256(source + parser fingerprint), so edits to the fixture, the
+ * parser sources or the installed grammars all invalidate the cached entry
+ *
+ * @param source Fixture source content
+ * @returns Cache key safe to use as a filename
+ */
+async function getCacheKey(source: string): Promise<string> {
+  return createHash('sha256')
+    .update(source, 'utf-8')
+    .update('\0')
+    .update(await getParserFingerprint())
+    .digest('hex');
+}
+
+/**
+ * Parse a fixture file, reusing a cached ASTDoc when the source is unchanged
+ *
+ * Only use this for tests that assert on extracted structure. Tests that
+ * measure parse timing or compare fresh parses must call parse() directly.
+ * The returned ASTDoc is shared between callers and must not be mutated.
+ *
+ * @param filePath Absolute path to the fixture file
+ * @returns ASTDoc for the fixture
+ */
+export function parseFixtureCached(filePath: string): Promise<ASTDoc> {
+  return memoizeByFileVersion(filePath, 'astdoc', () => loadFixture(filePath));
+}
+
+/**
+ * Load a fixture ASTDoc from the on-disk cache, parsing on a miss
+ *
+ * @param filePath Absolute path to the fixture file
+ * @returns ASTDoc for the fixture
+ */
+async function loadFixture(filePath: string): Promise<ASTDoc> {
+  const source = await fs.readFile(filePath, 'utf-8');
+  const cachePath = path.join(AST_CACHE_DIR, `${await getCacheKey(source)}.json`);
+
+  try {
+    const json = await fs.readFile(cachePath, 'utf-8');
+    const cached = JSON.parse(json) as ASTDoc;
+    // The same content may live at different paths; report the requested one
+    return { ...cached, file: filePath };
+  } catch (error) {
+    // Missing or truncated entries are treated as a cache miss
+    if (!(error instanceof SyntaxError) && (error as NodeJS.ErrnoException).code !== 'ENOENT') {
+      throw error;
+    }
+  }
+
+  const astDoc = await parse(filePath, { content: source });
+
+  await fs.mkdir(AST_CACHE_DIR, { recursive: true });
+  // Write then rename so parallel test workers never read a partial entry;
+  // the random suffix keeps thread-pool workers sharing a pid apart
+  const tmpPath = `${cachePath}.${randomUUID()}.tmp`;
+  await fs.writeFile(tmpPath, JSON.stringify(astDoc), 'utf-8');
+  await fs.rename(tmpPath, cachePath);
+
+  return astDoc;
+}
@@ -12,8 +12,7 @@
 
 import { describe, it, expect, beforeAll } from 'vitest';
 import path from 'path';
-import fs from 'fs';
-import { parseAndChunk } from '../../helpers/chunker-test-helper';
+import { chunkFixture, parseAndChunk } from '../../helpers/chunker-test-helper';
 import { ChunkType, Language } from '../../../src/models/ChunkTypes';
 import { Chunk } from '../../../src/models/Chunk';
 
@@ -25,8 +24,7 @@ describe('Python Chunking Integration', () => {
     const testFile = path.join(fixturesDir, 'simple_functions.py');
 
     beforeAll(async () => {
-      const content = fs.readFileSync(testFile, 'utf-8');
-      chunks = await parseAndChunk(testFile, content, Language.Python);
+      chunks = await chunkFixture(testFile, Language.Python);
     });
 
     it('should extract all top-level functions', () => {
@@ -74,8 +72,7 @@ describe('Python Chunking Integration', () => {
     const testFile = path.join(fixturesDir, 'class_methods.py');
 
     beforeAll(async () => {
-      const content = fs.readFileSync(testFile, 'utf-8');
-      chunks = await parseAndChunk(testFile, content, Language.Python);
+      chunks = await chunkFixture(testFile, Language.Python);
     });
 
     it('should extract class methods', () => {
@@ -296,8 +293,7 @@ def test():
     const testFile = path.join(fixturesDir, 'simple_functions.py');
 
     beforeAll(async () => {
-      const content = fs.readFileSync(testFile, 'utf-8');
-      chunks = await parseAndChunk(testFile, content, Language.Python);
+      chunks = await chunkFixture(testFile, Language.Python);
     });
 
     it('should include valid line numbers', () => {
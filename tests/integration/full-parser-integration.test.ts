@@ -10,6 +10,7 @@ import { describe, it, expect, beforeAll } from 'vitest';
 import { readFileSync } from 'fs';
 import { join } from 'path';
 import { parse } from '../../src/services/parser/index.js';
+import { parseFixtureCached } from '../helpers/parser-test-helper.js';
 import type { ParseResult } from '../../src/models/ParseResult.js';
 
 const FIXTURES_DIR = join(process.cwd(), 'tests/fixtures/parser');
@@ -27,12 +28,12 @@ describe('Full Parser Integration - End-to-End', () => {
   let pyResult: ParseResult;
 
   beforeAll(async () => {
-    // Parse all language fixtures once
-    tsResult = await parse(join(FIXTURES_DIR, 'sample.ts'));
-    jsResult = await parse(join(FIXTURES_DIR, 'sample.js'));
-    tsxResult = await parse(join(FIXTURES_DIR, 'sample.tsx'));
-    jsxResult = await parse(join(FIXTURES_DIR, 'sample.jsx'));
-    pyResult = await parse(join(FIXTURES_DIR, 'sample.py'));
+    // Parse all language fixtures once (cached on disk across runs)
+    tsResult = await parseFixtureCached(join(FIXTURES_DIR, 'sample.ts'));
+    jsResult = await parseFixtureCached(join(FIXTURES_DIR, 'sample.js'));
+    tsxResult = await parseFixtureCached(join(FIXTURES_DIR, 'sample.tsx'));
+    jsxResult = await parseFixtureCached(join(FIXTURES_DIR, 'sample.jsx'));
+    pyResult = await parseFixtureCached(join(FIXTURES_DIR, 'sample.py'));
   });
 
   describe('Scenario 1: Parse real project files → all features work together', () => {
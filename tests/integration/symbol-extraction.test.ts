@@ -7,6 +7,7 @@
 
 import { describe, it, expect } from 'vitest';
 import { parse } from '../../src/services/parser/index.js';
+import { parseFixtureCached } from '../helpers/parser-test-helper.js';
 import { resolve } from 'path';
 
 const FIXTURES_DIR = resolve(__dirname, '../fixtures/parser');
@@ -88,7 +89,7 @@ describe('Symbol Extraction - Integration Tests', () => {
   describe('Python File Extraction', () => {
     it('should extract class methods with signatures', async () => {
       const filePath = resolve(FIXTURES_DIR, 'sample.py');
-      const result = await parse(filePath);
+      const result = await parseFixtureCached(filePath);
 
       expect(result.language).toBe('python');
       expect(result.symbols.length).toBeGreaterThan(0);